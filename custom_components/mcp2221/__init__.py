@@ -27,8 +27,7 @@ from homeassistant.const import (
     CONF_UNIT_OF_MEASUREMENT,
     CONF_VALUE_TEMPLATE,
     SERVICE_RELOAD,
-    Platform,
-    UnitOfInformation)
+    Platform)
 
 from homeassistant.components.binary_sensor import (
     DEVICE_CLASSES_SCHEMA as BINARY_SENSOR_DEVICE_CLASSES_SCHEMA,
@@ -45,7 +44,18 @@ from homeassistant.components.sensor import (
 from MCP2221 import MCP2221
 
 from .const import (CONF_DEV, CONF_PID, CONF_VID,
-                    CONF_INVERTED, CONF_ADC_REF, CONF_ADC, DOMAIN, LOGGER)
+                    CONF_INVERTED, CONF_ADC_REF, CONF_ADC_VDD, CONF_ADC,
+                    CONF_CONVERSION, CONF_DIVIDER, CONF_MULTIPLIER,
+                    CONF_OFFSET, DOMAIN, LOGGER)
+from .conversion import (CONVERSIONS, CONVERSION_RAW, CONVERSION_VOLTAGE,
+                         CONVERSION_PERCENT, CONVERSION_CUSTOM)
+
+CONVERSION_KEYS = {
+    CONVERSION_RAW: (),
+    CONVERSION_VOLTAGE: (CONF_DIVIDER,),
+    CONVERSION_PERCENT: (),
+    CONVERSION_CUSTOM: (CONF_DIVIDER, CONF_MULTIPLIER, CONF_OFFSET),
+}
 
 PLATFORM_MAPPING = {
     CONF_ADC: Platform.SENSOR,
@@ -65,10 +75,16 @@ SENSOR_SCHEMA = vol.Schema(
         ): vol.All(cv.time_period, cv.positive_timedelta),
         vol.Optional(CONF_ICON): cv.template,
         vol.Optional(CONF_DEVICE_CLASS): SENSOR_DEVICE_CLASSES_SCHEMA,
-        vol.Optional(
-            CONF_UNIT_OF_MEASUREMENT, default=UnitOfInformation.BITS
-        ): cv.string,
+        vol.Optional(CONF_UNIT_OF_MEASUREMENT): cv.string,
         vol.Optional(CONF_VALUE_TEMPLATE): cv.template,
+        vol.Optional(CONF_CONVERSION, default=CONVERSION_RAW): vol.In(
+            CONVERSIONS
+        ),
+        vol.Optional(CONF_DIVIDER): vol.All(
+            vol.Coerce(float), vol.Range(min=0, min_included=False)
+        ),
+        vol.Optional(CONF_MULTIPLIER): vol.Coerce(float),
+        vol.Optional(CONF_OFFSET): vol.Coerce(float),
         vol.Optional(
             CONF_STATE_CLASS, default=SensorStateClass.MEASUREMENT
         ): SENSOR_STATE_CLASSES_SCHEMA,
@@ -76,10 +92,28 @@ SENSOR_SCHEMA = vol.Schema(
     required=True,
 )
 
+
+def validate_conversion(config: dict[str, Any]) -> dict[str, Any]:
+    """Reject calibration keys not used by the selected conversion."""
+    conversion = config[CONF_CONVERSION]
+
+    for key in (CONF_DIVIDER, CONF_MULTIPLIER, CONF_OFFSET):
+        if key in config and key not in CONVERSION_KEYS[conversion]:
+            raise vol.Invalid(
+                f"'{key}' is not used by conversion '{conversion}'")
+
+    return config
+
+
 ADC_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_ADC_REF): vol.In(["VDD", 1.024, 2.048, 4.096]),
-        vol.Required(CONF_SENSORS): [SENSOR_SCHEMA],
+        vol.Optional(CONF_ADC_VDD, default=3.3): vol.All(
+            vol.Coerce(float), vol.Range(min=0, min_included=False)
+        ),
+        vol.Required(CONF_SENSORS): [
+            vol.All(SENSOR_SCHEMA, validate_conversion)
+        ],
     },
     required=True,
 )
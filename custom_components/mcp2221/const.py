@@ -21,3 +21,8 @@ CONF_DEV = "dev"
 CONF_INVERTED = "inverted"
 CONF_ADC_REF = "ref"
 CONF_ADC = "adc"
+CONF_ADC_VDD = "vdd"
+CONF_CONVERSION = "conversion"
+CONF_DIVIDER = "divider"
+CONF_MULTIPLIER = "multiplier"
+CONF_OFFSET = "offset"
@@ -0,0 +1,80 @@
+"""MCP2221 ADC value conversion"""
+
+from functools import lru_cache
+
+ADC_RESOLUTION = 1024
+PRECISION = 3
+
+CONVERSION_RAW = "raw"
+CONVERSION_VOLTAGE = "voltage"
+CONVERSION_PERCENT = "percent"
+CONVERSION_CUSTOM = "custom"
+
+CONVERSIONS = [
+    CONVERSION_RAW,
+    CONVERSION_VOLTAGE,
+    CONVERSION_PERCENT,
+    CONVERSION_CUSTOM,
+]
+
+
+@lru_cache(maxsize=32)
+def _build_table(
+    mode: str,
+    ref_voltage: float,
+    divider: float,
+    multiplier: float,
+    offset: float,
+) -> tuple[float, ...]:
+    """Precompute converted value for every possible ADC count."""
+    full_scale = ADC_RESOLUTION - 1
+
+    if mode == CONVERSION_PERCENT:
+        values = (count * 100 / full_scale for count in range(ADC_RESOLUTION))
+
+    else:
+        values = (count * ref_voltage * divider / full_scale
+                  for count in range(ADC_RESOLUTION))
+
+        # custom scale is unknown, keep full resolution
+        if mode == CONVERSION_CUSTOM:
+            return tuple(value * multiplier + offset for value in values)
+
+    return tuple(round(value, PRECISION) for value in values)
+
+
+class ADCConverter:
+    """Convert raw ADC counts using a precomputed lookup table.
+
+    Tables are cached per reference and calibration, so converters with
+    the same settings share one table and it is only rebuilt when those
+    settings change.
+    """
+
+    def __init__(
+        self,
+        mode: str = CONVERSION_RAW,
+        ref_voltage: float = 0.0,
+        divider: float = 1.0,
+        multiplier: float = 1.0,
+        offset: float = 0.0,
+    ) -> None:
+        """Initialize the converter."""
+        self._table: tuple[float, ...] | None = None
+
+        if mode != CONVERSION_RAW:
+            self._table = _build_table(
+                mode, ref_voltage, divider, multiplier, offset)
+
+    def convert(self, value: int | None) -> float | int | None:
+        """Convert raw ADC count."""
+        if value is None:
+            return None
+
+        if not 0 <= value < ADC_RESOLUTION:
+            raise ValueError(f"ADC count {value} out of range")
+
+        if self._table is None:
+            return value
+
+        return self._table[value]
@@ -18,7 +18,11 @@ from homeassistant.const import (
     CONF_SCAN_INTERVAL,
     CONF_UNIT_OF_MEASUREMENT,
     CONF_SENSORS,
-    CONF_VALUE_TEMPLATE
+    CONF_VALUE_TEMPLATE,
+    ATTR_UNIT_OF_MEASUREMENT,
+    PERCENTAGE,
+    UnitOfElectricPotential,
+    UnitOfInformation
 )
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
@@ -30,7 +34,11 @@ from homeassistant.helpers.trigger_template_entity import (
     ManualTriggerSensorEntity
 )
 
-from .const import (LOGGER, DOMAIN, CONF_ADC_REF)
+from .const import (LOGGER, DOMAIN, CONF_ADC_REF, CONF_ADC_VDD,
+                    CONF_CONVERSION, CONF_DIVIDER, CONF_MULTIPLIER,
+                    CONF_OFFSET)
+from .conversion import (ADCConverter, CONVERSION_RAW, CONVERSION_VOLTAGE,
+                         CONVERSION_PERCENT)
 from MCP2221 import MCP2221
 
 TRIGGER_ENTITY_OPTIONS = (
@@ -41,6 +49,12 @@ TRIGGER_ENTITY_OPTIONS = (
     CONF_STATE_CLASS
 )
 
+DEFAULT_UNITS = {
+    CONVERSION_RAW: UnitOfInformation.BITS,
+    CONVERSION_VOLTAGE: UnitOfElectricPotential.VOLT,
+    CONVERSION_PERCENT: PERCENTAGE,
+}
+
 
 async def async_setup_platform(
     hass: HomeAssistant,
@@ -61,6 +75,7 @@ async def async_setup_platform(
         scan_interval: timedelta = sensor.get(CONF_SCAN_INTERVAL)
         pin: int = sensor.get(CONF_PIN)
         value_template: Template | None = sensor.get(CONF_VALUE_TEMPLATE)
+        conversion: str = sensor.get(CONF_CONVERSION)
 
         trigger_entity_config = {CONF_NAME: name}
         for key in TRIGGER_ENTITY_OPTIONS:
@@ -68,6 +83,12 @@ async def async_setup_platform(
                 continue
             trigger_entity_config[key] = sensor.get(key)
 
+        # default unit follows the conversion
+        if (CONF_UNIT_OF_MEASUREMENT not in trigger_entity_config and
+                conversion in DEFAULT_UNITS):
+            trigger_entity_config[CONF_UNIT_OF_MEASUREMENT] = (
+                DEFAULT_UNITS.get(conversion))
+
         # get MCP2221 instance
         device_instance = hass.data[DOMAIN].get(
             sensor.get(CONF_DEVICE_ID))
@@ -79,6 +100,7 @@ async def async_setup_platform(
         # set ADC reference
         conf_ref = discovery_info.get(CONF_ADC_REF)
         ref = MCP2221.VRM.VDD
+        ref_voltage = discovery_info.get(CONF_ADC_VDD)
 
         if conf_ref == 1.024:
             ref = MCP2221.VRM.REF_1_024V
@@ -87,8 +109,19 @@ async def async_setup_platform(
         elif conf_ref == 4.096:
             ref = MCP2221.VRM.REF_4_096V
 
+        if conf_ref != "VDD":
+            ref_voltage = conf_ref
+
         device_instance["device"].SetADCVoltageReference(ref)
 
+        converter = ADCConverter(
+            conversion,
+            ref_voltage,
+            sensor.get(CONF_DIVIDER, 1.0),
+            sensor.get(CONF_MULTIPLIER, 1.0),
+            sensor.get(CONF_OFFSET, 0.0),
+        )
+
         sensors.append(
             MCP2221Sensor(
                 hass,
@@ -96,7 +129,8 @@ async def async_setup_platform(
                 value_template,
                 device_instance,
                 pin,
-                scan_interval
+                scan_interval,
+                converter
             )
         )
 
@@ -117,6 +151,7 @@ class MCP2221Sensor(ManualTriggerEntity, RestoreSensor):
         device,
         pin: int,
         scan_interval: timedelta,
+        converter: ADCConverter,
     ) -> None:
         """Initialize the sensor."""
         ManualTriggerSensorEntity.__init__(self, hass, config)
@@ -125,18 +160,28 @@ class MCP2221Sensor(ManualTriggerEntity, RestoreSensor):
         self._pin = pin
         self._scan_interval = scan_interval
         self._value_template = value_template
+        self._converter = converter
 
         # init GP
         self._device.InitGP(pin, MCP2221.TYPE.ADC)
-        self._attr_native_value = self._device.ReadADC(self._pin)
+
+        try:
+            self._attr_native_value = self._converter.convert(
+                self._device.ReadADC(self._pin))
+        except ValueError as err:
+            LOGGER.error("Invalid ADC reading: %s", err)
+            self._attr_native_value = None
 
     async def async_added_to_hass(self) -> None:
         """Call when entity about to be added to hass."""
         await super().async_added_to_hass()
 
-        # get previous state
-        if (state := await self.async_get_last_sensor_data()) is not None:
-            self._attr_native_value = state.native_value
+        # get previous state, unless the unit changed meanwhile
+        if ((state := await self.async_get_last_state()) is not None and
+                state.attributes.get(ATTR_UNIT_OF_MEASUREMENT) ==
+                self.unit_of_measurement and
+                (data := await self.async_get_last_sensor_data()) is not None):
+            self._attr_native_value = data.native_value
 
         self.async_on_remove(
             async_track_time_interval(
@@ -157,6 +202,13 @@ class MCP2221Sensor(ManualTriggerEntity, RestoreSensor):
             LOGGER.error("Device not available")
             value = None
 
+        # apply conversion
+        try:
+            value = self._converter.convert(value)
+        except ValueError as err:
+            LOGGER.error("Invalid ADC reading: %s", err)
+            value = None
+
         # apply value template
         if self._value_template is not None and value is not None:
             self._attr_native_value = (
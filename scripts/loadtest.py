@@ -0,0 +1,507 @@
+"""MCP2221 load/soak test harness
+
+Starts Home Assistant with a generated configuration of many simulated
+MCP2221 boards and reports event loop lag, HID transactions, lock wait
+times, memory growth and state writes as JSON.
+
+    python scripts/loadtest.py --boards 8 --duration 120 -o run.json
+"""
+
+import argparse
+import asyncio
+from collections import Counter
+import json
+import os
+import platform
+import random
+import resource
+import sys
+import tempfile
+import time
+import tracemalloc
+import types
+from typing import Any
+
+import yaml
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DOMAIN = "mcp2221"
+
+LAYOUT_ENTITY_DOMAINS = {
+    "s": "switch",
+    "b": "binary_sensor",
+    "a": "sensor",
+}
+
+
+class Stats:
+    """Counters shared by the simulated devices and instrumented locks."""
+
+    def __init__(self) -> None:
+        """Initialize counters."""
+        self.hid_calls: Counter = Counter()
+        self.lock_waits: list[float] = []
+        self.recording = False
+
+    def start(self) -> None:
+        """Reset counters and start recording."""
+        self.hid_calls.clear()
+        self.lock_waits.clear()
+        self.recording = True
+
+
+STATS = Stats()
+
+
+def build_mcp2221_stub(latency: float) -> types.ModuleType:
+    """Create a fake 'MCP2221' package that simulates HID transactions."""
+
+    class TYPE:
+        INPUT = 0
+        OUTPUT = 1
+        ADC = 2
+
+    class VRM:
+        VDD = 0
+        REF_1_024V = 1
+        REF_2_048V = 2
+        REF_4_096V = 3
+
+    class MCP2221:
+        """Simulated board, every call is one blocking HID transaction."""
+
+        def __init__(self, vid: int, pid: int, dev: int = 0) -> None:
+            self._gp = [0, 0, 0, 0]
+            self._types = [TYPE.INPUT] * 4
+
+        def _transaction(self, name: str) -> None:
+            if STATS.recording:
+                STATS.hid_calls[name] += 1
+
+            # busy-wait like a blocking hidapi call, time.sleep() would be
+            # caught by Home Assistant's blocking call detector
+            end = time.perf_counter() + latency
+
+            while time.perf_counter() < end:
+                pass
+
+        def InitGP(self, pin: int, gp_type: int, value=False) -> None:
+            self._transaction("InitGP")
+            self._types[pin] = gp_type
+            self._gp[pin] = int(value)
+
+        def GetGPType(self, pin: int) -> int:
+            self._transaction("GetGPType")
+            return self._types[pin]
+
+        def SetADCVoltageReference(self, ref: int) -> None:
+            self._transaction("SetADCVoltageReference")
+
+        def ReadADC(self, pin: int) -> int:
+            self._transaction("ReadADC")
+            return random.randint(0, 1023)
+
+        def ReadGP(self, pin: int) -> int:
+            self._transaction("ReadGP")
+
+            if self._types[pin] == TYPE.OUTPUT:
+                return self._gp[pin]
+
+            return random.randint(0, 1)
+
+        def WriteGP(self, pin: int, value: int) -> None:
+            self._transaction("WriteGP")
+            self._gp[pin] = value
+
+    package = types.ModuleType("MCP2221")
+    package.__path__ = []
+    module = types.ModuleType("MCP2221.MCP2221")
+    module.MCP2221 = MCP2221
+    module.TYPE = TYPE
+    module.VRM = VRM
+    package.MCP2221 = module
+
+    return package
+
+
+class TimedLock(asyncio.Lock):
+    """Lock that records how long each acquire waited."""
+
+    async def acquire(self) -> bool:
+        start = time.perf_counter()
+        result = await super().acquire()
+
+        if STATS.recording:
+            STATS.lock_waits.append(time.perf_counter() - start)
+
+        return result
+
+
+class AsyncioProxy(types.ModuleType):
+    """Stand-in for 'asyncio' in the integration, creating timed locks."""
+
+    Lock = TimedLock
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(asyncio, name)
+
+
+def build_config(args: argparse.Namespace) -> dict[str, Any]:
+    """Generate configuration.yaml content."""
+    boards = []
+
+    for board in range(args.boards):
+        board_config: dict[str, Any] = {"dev": board}
+
+        for pin, kind in enumerate(args.layout):
+            name = f"Board {board} GP{pin}"
+            unique_id = f"loadtest_{board}_{pin}"
+
+            if kind == "s":
+                board_config.setdefault("switches", []).append({
+                    "name": name,
+                    "pin": pin,
+                    "unique_id": unique_id,
+                })
+            elif kind == "b":
+                board_config.setdefault("binary_sensors", []).append({
+                    "name": name,
+                    "pin": pin,
+                    "unique_id": unique_id,
+                    "scan_interval": args.binary_sensor_interval,
+                })
+            elif kind == "a":
+                board_config.setdefault(
+                    "adc", {"ref": "VDD", "sensors": []}
+                )["sensors"].append({
+                    "name": name,
+                    "pin": pin,
+                    "unique_id": unique_id,
+                    "scan_interval": args.adc_interval,
+                    "conversion": "voltage",
+                })
+
+        boards.append(board_config)
+
+    return {
+        "homeassistant": {"name": "MCP2221 load test"},
+        "logger": {"default": args.log_level},
+        DOMAIN: boards,
+    }
+
+
+def percentiles(values: list[float], scale: float = 1000) -> dict[str, Any]:
+    """Summarize samples, scaled to milliseconds by default."""
+    if not values:
+        return {"samples": 0}
+
+    ordered = sorted(values)
+
+    def rank(p: float) -> float:
+        index = min(len(ordered) - 1, int(p / 100 * len(ordered)))
+        return round(ordered[index] * scale, 3)
+
+    return {
+        "samples": len(ordered),
+        "mean": round(sum(ordered) / len(ordered) * scale, 3),
+        "p50": rank(50),
+        "p90": rank(90),
+        "p99": rank(99),
+        "p999": rank(99.9),
+        "max": round(ordered[-1] * scale, 3),
+    }
+
+
+def rss_kib() -> int | None:
+    """Current resident set size."""
+    try:
+        with open("/proc/self/statm", encoding="utf-8") as statm:
+            pages = int(statm.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") // 1024
+
+    except (OSError, ValueError):
+        return None
+
+
+async def measure_lag(
+    interval: float,
+    samples: list[float],
+    stop: asyncio.Event,
+) -> None:
+    """Sample how late the event loop wakes up a sleeping task."""
+    loop = asyncio.get_running_loop()
+
+    while not stop.is_set():
+        start = loop.time()
+        await asyncio.sleep(interval)
+        samples.append(max(0.0, loop.time() - start - interval))
+
+
+async def toggle_switches(
+    hass,
+    entity_ids: list[str],
+    rate: float,
+    stop: asyncio.Event,
+) -> None:
+    """Toggle random switches at a fixed rate."""
+    while entity_ids and not stop.is_set():
+        await asyncio.sleep(1 / rate)
+        await hass.services.async_call(
+            "switch", "toggle", {"entity_id": random.choice(entity_ids)},
+            blocking=True,
+        )
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    """Run the load test."""
+    from homeassistant import bootstrap
+    from homeassistant.runner import RuntimeConfig
+
+    with tempfile.TemporaryDirectory(prefix="mcp2221-loadtest-") as conf_dir:
+        os.symlink(os.path.join(ROOT, "custom_components"),
+                   os.path.join(conf_dir, "custom_components"))
+
+        with open(os.path.join(conf_dir, "configuration.yaml"), "w",
+                  encoding="utf-8") as config_file:
+            yaml.safe_dump(build_config(args), config_file)
+
+        # instrument the device locks before Home Assistant loads us
+        sys.path.insert(0, conf_dir)
+        integration = __import__(f"custom_components.{DOMAIN}",
+                                 fromlist=[DOMAIN])
+        integration.asyncio = AsyncioProxy("asyncio")
+
+        rss_start_setup = rss_kib()
+        setup_start = time.perf_counter()
+        hass = await bootstrap.async_setup_hass(
+            RuntimeConfig(config_dir=conf_dir,
+                          skip_pip_packages=["mcp2221"])
+        )
+
+        if hass is None:
+            raise SystemExit("Failed to start Home Assistant")
+
+        try:
+            return await measure(hass, args, setup_start, rss_start_setup)
+
+        finally:
+            await hass.async_stop()
+            sys.path.remove(conf_dir)
+
+
+async def measure(
+    hass,
+    args: argparse.Namespace,
+    setup_start: float,
+    rss_start_setup: int | None,
+) -> dict[str, Any]:
+    """Start Home Assistant, measure and build the report."""
+    from homeassistant.const import (
+        EVENT_STATE_CHANGED,
+        __version__ as ha_version,
+    )
+    from homeassistant.core import callback
+    from homeassistant.helpers.entity_platform import async_get_platforms
+
+    try:
+        from homeassistant.const import EVENT_STATE_REPORTED
+    except ImportError:
+        EVENT_STATE_REPORTED = None
+
+    if DOMAIN not in hass.config.components:
+        raise SystemExit(f"Failed to set up {DOMAIN}")
+
+    await hass.async_start()
+    setup_time = time.perf_counter() - setup_start
+
+    entity_ids = [
+        entity_id
+        for entity_platform in async_get_platforms(hass, DOMAIN)
+        for entity_id in entity_platform.entities
+    ]
+    entity_counts = Counter(
+        entity_id.split(".")[0] for entity_id in entity_ids)
+    expected_counts = Counter(
+        LAYOUT_ENTITY_DOMAINS[kind]
+        for kind in args.layout if kind in LAYOUT_ENTITY_DOMAINS
+    )
+
+    for entity_domain in expected_counts:
+        expected_counts[entity_domain] *= args.boards
+
+    if entity_counts != expected_counts:
+        raise SystemExit(
+            f"Entities set up {dict(entity_counts)} don't match "
+            f"configured {dict(expected_counts)}, check the log")
+
+    tracked = set(entity_ids)
+    writes: Counter = Counter()
+
+    @callback
+    def _count_write(event) -> None:
+        if STATS.recording and event.data.get("entity_id") in tracked:
+            writes[event.event_type] += 1
+
+    @callback
+    def _filter(event_data) -> bool:
+        return event_data.get("entity_id") in tracked
+
+    unsubs = [hass.bus.async_listen(EVENT_STATE_CHANGED, _count_write)]
+
+    if EVENT_STATE_REPORTED is not None:
+        unsubs.append(hass.bus.async_listen(
+            EVENT_STATE_REPORTED, _count_write, event_filter=_filter))
+
+    stop = asyncio.Event()
+    tasks: list[asyncio.Task] = []
+
+    try:
+        await asyncio.sleep(args.warmup)
+
+        # measurement window
+        if args.tracemalloc:
+            tracemalloc.start()
+
+        lag_samples: list[float] = []
+        rss_start = rss_kib()
+        STATS.start()
+        window_start = time.perf_counter()
+
+        tasks.append(asyncio.create_task(
+            measure_lag(args.lag_interval, lag_samples, stop)))
+
+        if args.switch_toggle_rate > 0:
+            tasks.append(asyncio.create_task(toggle_switches(
+                hass,
+                [e for e in entity_ids if e.startswith("switch.")],
+                args.switch_toggle_rate,
+                stop,
+            )))
+
+        await asyncio.sleep(args.duration)
+
+        STATS.recording = False
+        elapsed = time.perf_counter() - window_start
+        rss_end = rss_kib()
+        traced = None
+
+        if args.tracemalloc:
+            current, peak = tracemalloc.get_traced_memory()
+            traced = {"current_kib": current // 1024,
+                      "peak_kib": peak // 1024}
+
+    finally:
+        STATS.recording = False
+        stop.set()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+        for unsub in unsubs:
+            unsub()
+
+    hid_total = sum(STATS.hid_calls.values())
+    write_total = sum(writes.values())
+
+    return {
+        "params": vars(args),
+        "environment": {
+            "python": platform.python_version(),
+            "homeassistant": ha_version,
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        },
+        "entities": dict(entity_counts),
+        "setup_s": round(setup_time, 3),
+        "duration_s": round(elapsed, 3),
+        "event_loop_lag_ms": percentiles(lag_samples),
+        "hid": {
+            "transactions": hid_total,
+            "per_second": round(hid_total / elapsed, 2),
+            "by_call": dict(STATS.hid_calls),
+        },
+        "lock_wait_ms": percentiles(STATS.lock_waits),
+        "memory": {
+            "rss_before_setup_kib": rss_start_setup,
+            "rss_start_kib": rss_start,
+            "rss_end_kib": rss_end,
+            "rss_growth_kib": (rss_end - rss_start
+                               if None not in (rss_start, rss_end) else None),
+            "max_rss_kib": resource.getrusage(
+                resource.RUSAGE_SELF).ru_maxrss,
+            "tracemalloc": traced,
+        },
+        "state_writes": {
+            "changed": writes[EVENT_STATE_CHANGED],
+            "reported": (writes[EVENT_STATE_REPORTED]
+                         if EVENT_STATE_REPORTED is not None else None),
+            "per_second": round(write_total / elapsed, 2),
+        },
+    }
+
+
+def layout(value: str) -> str:
+    """Validate pin layout, one letter per GP0-GP3."""
+    value = value.lower()
+
+    if len(value) != 4 or any(
+        kind not in LAYOUT_ENTITY_DOMAINS and kind != "-" for kind in value
+    ):
+        raise argparse.ArgumentTypeError(
+            "layout must be 4 characters of 's', 'b', 'a' or '-'")
+
+    if value[0] == "a":
+        raise argparse.ArgumentTypeError("GP0 has no ADC")
+
+    return value
+
+
+def main() -> None:
+    """Parse arguments and run."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--boards", type=int, default=4,
+                        help="number of simulated boards")
+    parser.add_argument("--layout", type=layout, default="sbaa",
+                        help="GP0-GP3 usage: s=switch, b=binary sensor, "
+                             "a=ADC, -=unused (default: sbaa)")
+    parser.add_argument("--duration", type=float, default=60,
+                        help="measurement window in seconds")
+    parser.add_argument("--warmup", type=float, default=5,
+                        help="seconds to run before measuring")
+    parser.add_argument("--adc-interval", type=float, default=0.1,
+                        help="ADC sensor scan_interval in seconds")
+    parser.add_argument("--binary-sensor-interval", type=float, default=0.1,
+                        help="binary sensor scan_interval in seconds")
+    parser.add_argument("--switch-toggle-rate", type=float, default=1,
+                        help="switch toggles per second, 0 to disable")
+    parser.add_argument("--hid-latency", type=float, default=0.002,
+                        help="simulated blocking time of one HID "
+                             "transaction in seconds")
+    parser.add_argument("--lag-interval", type=float, default=0.01,
+                        help="event loop lag sampling period in seconds")
+    parser.add_argument("--tracemalloc", action="store_true",
+                        help="trace Python allocations (adds overhead)")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="random seed for simulated readings")
+    parser.add_argument("--log-level", default="warning",
+                        help="Home Assistant log level")
+    parser.add_argument("-o", "--output",
+                        help="write JSON report to file instead of stdout")
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    sys.modules["MCP2221"] = build_mcp2221_stub(args.hid_latency)
+    sys.modules["MCP2221.MCP2221"] = sys.modules["MCP2221"].MCP2221
+
+    report = json.dumps(asyncio.run(run(args)), indent=2)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            output.write(report + "\n")
+    else:
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Tests for MCP2221 ADC value conversion"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir,
+                                "custom_components", "mcp2221"))
+
+from conversion import (ADCConverter, CONVERSION_RAW,  # noqa: E402
+                        CONVERSION_VOLTAGE, CONVERSION_PERCENT,
+                        CONVERSION_CUSTOM)
+
+
+@pytest.mark.parametrize(
+    ("converter", "low", "high"),
+    [
+        (ADCConverter(CONVERSION_RAW), 0, 1023),
+        (ADCConverter(CONVERSION_VOLTAGE, 4.096), 0.0, 4.096),
+        (ADCConverter(CONVERSION_VOLTAGE, 3.3, 6.6), 0.0, 21.78),
+        (ADCConverter(CONVERSION_PERCENT, 3.3), 0.0, 100.0),
+        (ADCConverter(CONVERSION_CUSTOM, 2.048, 1.0, 100, -50), -50.0,
+         pytest.approx(154.8)),
+    ],
+)
+def test_end_points(converter, low, high):
+    """Lowest and highest count map to the ends of the range."""
+    assert converter.convert(0) == low
+    assert converter.convert(1023) == high
+
+
+def test_rounding():
+    """Built-in modes are rounded, not float noise."""
+    assert ADCConverter(CONVERSION_PERCENT, 3.3).convert(512) == 50.049
+    assert ADCConverter(CONVERSION_VOLTAGE, 3.3, 6.6).convert(1023) == 21.78
+
+
+def test_custom_not_rounded():
+    """Custom mode keeps every step of a small range distinct."""
+    converter = ADCConverter(CONVERSION_CUSTOM, 3.3, 1.0, 0.01)
+    values = {converter.convert(count) for count in range(1024)}
+    assert len(values) == 1024
+
+
+@pytest.mark.parametrize("mode", [CONVERSION_RAW, CONVERSION_VOLTAGE,
+                                  CONVERSION_PERCENT, CONVERSION_CUSTOM])
+def test_none_passthrough(mode):
+    """Failed reading stays None."""
+    assert ADCConverter(mode, 3.3).convert(None) is None
+
+
+@pytest.mark.parametrize("count", [-1, 1024])
+@pytest.mark.parametrize("mode", [CONVERSION_RAW, CONVERSION_VOLTAGE])
+def test_out_of_range(mode, count):
+    """Counts outside of the 10-bit range are rejected."""
+    with pytest.raises(ValueError):
+        ADCConverter(mode, 3.3).convert(count)
+
+
+def test_shared_table():
+    """Converters with equal settings share one table."""
+    first = ADCConverter(CONVERSION_VOLTAGE, 2.048, 2.0)
+    second = ADCConverter(CONVERSION_VOLTAGE, 2.048, 2.0)
+    assert first._table is second._table